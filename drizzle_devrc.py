@@ -1,128 +1,4 @@
-def handle_devrc_command(self, tokens: List[str]):
-        """Handle .devrc specific commands"""
-        i = 0
-        while i < len(tokens):
-            token = tokens[i]
-            
-            if token == '-out' and i + 1 < len(tokens):
-                self.output_to_file(tokens[i + 1])
-                i += 2
-            
-            elif token == '-crfolder' and i + 1 < len(tokens):
-                self.create_folder(tokens[i + 1])
-                i += 2
-            
-            elif token == '-pop':
-                if i + 1 < len(tokens):
-                    print(f"✓ Pop operation: {tokens[i + 1]}")
-                i += 2
-            
-            elif token == '-plugin':
-                print("✓ Plugin mode enabled")
-                i += 1
-            
-            elif token == '-config':
-                print("✓ Config mode enabled")
-                i += 1
-            
-            elif token == '-c':
-                print("✓ Compile mode enabled")
-                i += 1
-            
-            elif token == '-timed':
-                print("✓ Timed operation enabled")
-                i += 1
-            
-            elif token == '-mode' and i + 1 < len(tokens):
-                print(f"✓ Mode set to: {tokens[i + 1]}")
-                i += 2
-            
-            elif token == '-force':
-                print("✓ Force mode enabled")
-                i += 1
-            
-            elif token == '-a':
-                print("✓ Append operation")
-                i += 1
-            
-            elif token == '-locate' and i + 1 < len(tokens):
-                print(f"✓ Locate: {tokens[i + 1]}")
-                i += 2
-            
-            elif token == '-to':
-                print("✓ Transform operation")
-                i += 1
-            
-            elif token == '-ext' and i + 1 < len(tokens):
-                print(f"✓ Extension: {tokens[i + 1]}")
-                i += 2
-            
-            elif token == '-cmdbin':
-                print("✓ Command binary mode")
-                i += 1
-            
-            elif token == '-cmdline':
-                print("✓ Command line mode")
-                i += 1
-            
-            elif token == '-rline' and i + 1 < len(tokens):
-                print(f"✓ Run line: {tokens[i + 1]}")
-                i += 2
-            
-            elif token == '-r' and i + 1 < len(tokens):
-                print(f"✓ Run mode: {tokens[i + 1]}")
-                i += 2
-            
-            elif token == '-byp':
-                print("✓ Bypass mode enabled")
-                i += 1
-            
-            elif token == '-h' and i + 1 < len(tokens):
-                print(f"✓ Handle pattern: {tokens[i + 1]}")
-                i += 2
-            
-            elif token == '-ch':
-                print("✓ Chain operation")
-                i += 1
-            
-            elif token == '-numline':
-                print("✓ Number line mode")
-                i += 1
-            
-            elif token == '-ff':
-                print("✓ Fast forward mode")
-                i += 1
-            
-            elif token == '-glob' and i + 1 < len(tokens):
-                print(f"✓ Glob pattern: {tokens[i + 1]}")
-                i += 2
-            
-            elif token == '-set':
-                print("✓ Set operation")
-                i += 1
-            
-            elif token == '-getline':
-                print("✓ Get line operation")
-                i += 1
-            
-            elif token == '-linenum':
-                print("✓ Line number operation")
-                i += 1
-            
-            elif token == '-activeline':
-                print("✓ Active line mode")
-                i += 1
-            
-            elif token == '-enable':
-                print("✓ Enable flag")
-                i += 1
-            
-            elif token == '-commitline':
-                print("✓ Commit line operation")
-                i += 1
-            
-            else:
-                i += 1#!/usr/bin/env python3
+#!/usr/bin/env python3
 """
 DevRC DSL Interpreter
 Parses and executes .devrc configuration files
@@ -130,47 +6,192 @@ Parses and executes .devrc configuration files
 
 import re
 import os
-import json
-import subprocess
-from pathlib import Path
+import sys
+from functools import lru_cache
 from typing import Dict, List, Any, Optional
 
 
+_RE_TOKEN = re.compile(r'(?:[^ \t"]+|"[^"]*(?:"|\Z))+')
+_RE_IMPORT = re.compile(r'@DEVRC\.IMPORT\.(\w+)(?:="?([^"]+)"?)?')
+_RE_INLINE_IMPORT = re.compile(r'@DEVRC\.IMPORT="([^"]+)"')
+_RE_VAR_STR = re.compile(r'is STR "([^"]+)"')
+_RE_FUNC_DEF = re.compile(r'function\s+(\w+)\s*\(')
+_RE_RETURN = re.compile(r'return\s+(.+)')
+_RE_EXPORT = re.compile(r'export\s+(\w+)\s*\(')
+_RE_ENV_CAT = re.compile(r'(\w+)=(\w+)\[(.+)\]')
+_RE_SUBENV = re.compile(r'subenv=\[([^\]]+)\]')
+_RE_THIS = re.compile(r'this\.(\w+)')
+_RE_OUT = re.compile(r'-out "([^"]+)"')
+_RE_IF = re.compile(r'if \((.*?)\) is (\S*)(?:\s+do\s+|\s+|$)')
+_RE_FOR = re.compile(r'for \((.*?)\)')
+
+_ENV_CATS = frozenset({'prod', 'dev', 'debug'})
+_EMPTY_CONTAINERS = frozenset({'{}', '[]'})
+_LITERALS = {'true': True, '-true': True, 'false': False, '-false': False, 'null': None}
+_MISSING = object()
+
+
+def _try_body(text: str) -> Optional[str]:
+    """Return the text between the first 'try (' and the last ')', if any"""
+    start = text.find('try')
+    close_idx = text.rfind(')')
+    while start != -1:
+        rest = text[start + 3:]
+        stripped = rest.lstrip()
+        if stripped[:1] == '(':
+            open_idx = len(text) - len(stripped)
+            if close_idx > open_idx + 1:
+                return text[open_idx + 1:close_idx]
+            return None
+        start = text.find('try', start + 1)
+    return None
+
+
+@lru_cache(maxsize=256)
+def _parse_if(line: str) -> Optional[tuple]:
+    """Split an if line into (variable, expected source, rest of line)"""
+    match = _RE_IF.match(line)
+    if match is None:
+        return None
+    return match[1].strip(), match[2].strip(), line[match.end():].strip()
+
+
 class DevRCInterpreter:
+    # .devrc flags that only report a status line
+    _FLAGS_0ARG = {
+        '-plugin': "✓ Plugin mode enabled",
+        '-config': "✓ Config mode enabled",
+        '-c': "✓ Compile mode enabled",
+        '-timed': "✓ Timed operation enabled",
+        '-force': "✓ Force mode enabled",
+        '-a': "✓ Append operation",
+        '-to': "✓ Transform operation",
+        '-cmdbin': "✓ Command binary mode",
+        '-cmdline': "✓ Command line mode",
+        '-byp': "✓ Bypass mode enabled",
+        '-ch': "✓ Chain operation",
+        '-numline': "✓ Number line mode",
+        '-ff': "✓ Fast forward mode",
+        '-set': "✓ Set operation",
+        '-getline': "✓ Get line operation",
+        '-linenum': "✓ Line number operation",
+        '-activeline': "✓ Active line mode",
+        '-enable': "✓ Enable flag",
+        '-commitline': "✓ Commit line operation",
+    }
+    
+    # .devrc flags that report the following token as their argument
+    _FLAGS_1ARG = {
+        '-pop': "✓ Pop operation: ",
+        '-mode': "✓ Mode set to: ",
+        '-locate': "✓ Locate: ",
+        '-ext': "✓ Extension: ",
+        '-rline': "✓ Run line: ",
+        '-r': "✓ Run mode: ",
+        '-h': "✓ Handle pattern: ",
+        '-glob': "✓ Glob pattern: ",
+    }
+    
     def __init__(self):
         self.variables = {}
         self.sections = {}
         self.section_types = {}
         self.current_section = None
-        self.imported_files = set()
-        self.import_stack = []
+        # Used as an ordered set so the summary lists imports in load order
+        self.imported_files: Dict[str, None] = {}
+        self.import_stack = set()
         self.environments = {}
         self.active_environment = None
         self.root_dir = os.getcwd()
+        # Relative paths resolve here; activation moves it instead of os.chdir
+        self._cwd = self.root_dir
+        self._log_buf: List[str] = []
+        self.verbose = True
+        self._parsed: Optional[tuple] = None
+        
+        # Line keyword -> handler, resolved with one lookup per line
+        self._head_dispatch = {
+            'dirlist': self.handle_dirlist,
+            'currentdir': self.handle_currentdir,
+            'subenv': self.handle_subenv,
+            **dict.fromkeys(_ENV_CATS, self.handle_environment_category),
+            'linenum': self.handle_linenum,
+            'current': self.handle_current_line,
+            'function': self.handle_function_definition,
+            'return': self.handle_return_statement,
+            'export': self.handle_export_statement,
+            'activate': self.handle_activate_keyword,
+            'if': self.handle_if_statement,
+            'for': self.handle_for_loop,
+            'get': self.handle_get_operation,
+            'in': self.handle_in_operation,
+            'try': self.handle_try_block,
+        }
+        self._token_dispatch = {
+            '.devrc': self.handle_devrc_command,
+            'do': self.handle_do_statement,
+            'out': self.handle_out_command,
+        }
         
+    def _log(self, msg: str):
+        """Queue a status line; written out by _flush_log"""
+        self._log_buf.append(msg)
+    
+    def _info(self, msg: str):
+        """Queue a per-line status message, unless running quietly"""
+        if self.verbose:
+            self._log_buf.append(msg)
+    
+    def _flush_log(self):
+        """Write queued status lines to stdout in one call"""
+        if self._log_buf:
+            sys.stdout.write('\n'.join(self._log_buf) + '\n')
+            self._log_buf.clear()
+    
+    def _resolve(self, path: str) -> str:
+        """Resolve a path against the interpreter's working directory"""
+        return os.path.join(self._cwd, path)
+    
     def parse_file(self, filepath: str) -> Dict[str, List[str]]:
         """Parse a .devrc file into sections"""
+        # Key the cache before parsing; activation can move self._cwd
+        abs_path = os.path.abspath(self._resolve(filepath))
+        try:
+            with open(self._resolve(filepath), 'r') as f:
+                sections = self._parse_stream(f, filepath)
+            self._parsed = (abs_path, sections)
+            return sections
+        finally:
+            self._flush_log()
+    
+    def _parse_stream(self, f, filepath: str) -> Dict[str, List[str]]:
+        """Parse an open .devrc file into sections"""
         # Prevent circular imports
-        abs_path = os.path.abspath(filepath)
+        abs_path = os.path.abspath(self._resolve(filepath))
         if abs_path in self.import_stack:
-            print(f"✗ Circular import detected: {filepath}")
+            self._log(f"✗ Circular import detected: {filepath}")
             return {}
         
-        self.import_stack.append(abs_path)
+        self.import_stack.add(abs_path)
         
-        with open(filepath, 'r') as f:
-            content = f.read()
+        base_dir = os.path.dirname(filepath)
         
-        sections = {}
+        sections: Dict[str, List[str]] = {}
         current_section = None
+        current_lines: List[str] = []
         current_type = None
         
-        for line in content.split('\n'):
-            original_line = line
+        # Stream lines from the file; strip() also drops the newline
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            c0 = line[0]
+            env_marker = c0 == '#' and line.startswith('#[')
             
             # Check for environment activation BEFORE removing comments
-            if line.strip().startswith('#[') and ']/ACTIVATE' in line:
-                self.handle_environment_activation(line.strip())
+            if env_marker and ']/ACTIVATE' in line:
+                self.handle_environment_activation(line)
                 continue
             
             # Check for inline imports with @DEVRC.IMPORT=
@@ -179,59 +200,47 @@ class DevRCInterpreter:
                 # Don't skip the line, let it be processed
             
             # Remove comments (but not environment markers)
-            if '#' in line and not line.strip().startswith('#['):
-                line = line.split('#')[0]
-            
-            line = line.strip()
-            if not line:
-                continue
-            
-            # Check for imports
-            if line.startswith('@DEVRC.IMPORT.'):
-                self.handle_import(line, os.path.dirname(filepath))
-                continue
-            
-            # Check for type annotations
-            if line.startswith('@[') and line.endswith(']'):
-                current_type = line[2:-1]
-                print(f"✓ Type annotation found: {current_type}")
-                continue
+            if c0 == '#':
+                if not env_marker:
+                    continue
+            else:
+                hash_idx = line.find('#')
+                if hash_idx >= 0:
+                    line = line[:hash_idx].rstrip()
+            
+            if c0 == '@':
+                # Check for imports
+                if line.startswith('@DEVRC.IMPORT.'):
+                    self.handle_import(line, base_dir)
+                    continue
                 
+                # Check for type annotations
+                if line.startswith('@[') and line.endswith(']'):
+                    current_type = line[2:-1]
+                    self._info(f"✓ Type annotation found: {current_type}")
+                    continue
+            
             # Check for section headers
-            if line.startswith('[') and line.endswith(']'):
+            if c0 == '[' and line.endswith(']'):
                 current_section = line[1:-1]
-                sections[current_section] = []
+                current_lines = sections[current_section] = []
                 if current_type:
                     self.section_types[current_section] = current_type
                     current_type = None
             elif current_section:
-                sections[current_section].append(line)
+                current_lines.append(line)
         
-        self.import_stack.pop()
+        self.import_stack.remove(abs_path)
         return sections
     
     def tokenize(self, line: str) -> List[str]:
         """Tokenize a line into components"""
-        # Handle quoted strings
-        tokens = []
-        current = []
-        in_quotes = False
-        
-        for char in line:
-            if char == '"':
-                in_quotes = not in_quotes
-                current.append(char)
-            elif char in [' ', '\t'] and not in_quotes:
-                if current:
-                    tokens.append(''.join(current))
-                    current = []
-            else:
-                current.append(char)
+        # Without quotes, tokens are just the runs between spaces and tabs
+        if '"' not in line:
+            return list(filter(None, line.replace('\t', ' ').split(' ')))
         
-        if current:
-            tokens.append(''.join(current))
-        
-        return tokens
+        # Split on spaces/tabs outside quotes; quoted runs stay in the token
+        return _RE_TOKEN.findall(line)
     
     def parse_assignment(self, line: str) -> Optional[tuple]:
         """Parse variable assignment"""
@@ -247,31 +256,27 @@ class DevRCInterpreter:
         expr = expr.strip()
         
         # Remove quotes
-        if expr.startswith('"') and expr.endswith('"'):
+        if expr and expr[0] == '"' and expr[-1] == '"':
             return expr[1:-1]
         
         # Check if it's a variable reference
-        if expr in self.variables:
-            return self.variables[expr]
-        
-        # Check for boolean literals
-        if expr.lower() in ['true', '-true']:
-            return True
-        if expr.lower() in ['false', '-false']:
-            return False
+        value = self.variables.get(expr, _MISSING)
+        if value is not _MISSING:
+            return value
         
-        # Check for null
-        if expr.lower() == 'null':
-            return None
+        # Check for boolean and null literals
+        value = _LITERALS.get(expr.lower(), _MISSING)
+        if value is not _MISSING:
+            return value
         
         return expr
     
     def handle_import(self, line: str, base_path: str):
         """Handle @DEVRC.IMPORT.[variablename] statements"""
         # Parse import statement: @DEVRC.IMPORT.[variablename] or @DEVRC.IMPORT.[variablename]="path"
-        match = re.match(r'@DEVRC\.IMPORT\.(\w+)(?:="?([^"]+)"?)?', line)
+        match = _RE_IMPORT.match(line)
         if not match:
-            print(f"✗ Invalid import syntax: {line}")
+            self._log(f"✗ Invalid import syntax: {line}")
             return
         
         var_name = match.group(1)
@@ -280,87 +285,92 @@ class DevRCInterpreter:
         # If no path specified, check if variable exists
         if not import_path:
             if var_name not in self.variables:
-                print(f"✗ Import failed: variable '{var_name}' not defined")
+                self._log(f"✗ Import failed: variable '{var_name}' not defined")
                 return
             import_path = self.variables[var_name]
         
-        # Resolve relative paths
-        if not os.path.isabs(import_path):
+        # Resolve relative paths; joining onto an empty base is a no-op
+        if base_path and not os.path.isabs(import_path):
             import_path = os.path.join(base_path, import_path)
         
         # Check if already imported
-        abs_import_path = os.path.abspath(import_path)
+        resolved_path = self._resolve(import_path)
+        abs_import_path = os.path.abspath(resolved_path)
         if abs_import_path in self.imported_files:
-            print(f"✓ Already imported: {import_path}")
+            self._info(f"✓ Already imported: {import_path}")
             return
         
-        # Check if file exists
-        if not os.path.exists(import_path):
-            print(f"✗ Import file not found: {import_path}")
+        # Open first instead of checking existence separately
+        try:
+            f = open(resolved_path, 'r')
+        except FileNotFoundError:
+            self._log(f"✗ Import file not found: {import_path}")
             return
         
-        print(f"✓ Importing from: {import_path}")
-        self.imported_files.add(abs_import_path)
+        self._info(f"✓ Importing from: {import_path}")
+        self.imported_files[abs_import_path] = None
         
         # Parse and merge the imported file
-        imported_sections = self.parse_file(import_path)
+        with f:
+            imported_sections = self._parse_stream(f, import_path)
+        sections = self.sections
         for section_name, lines in imported_sections.items():
-            if section_name in self.sections:
+            existing = sections.get(section_name)
+            if existing is not None:
                 # Merge with existing section
-                print(f"  ↳ Merging section: [{section_name}]")
-                self.sections[section_name].extend(lines)
+                self._info(f"  ↳ Merging section: [{section_name}]")
+                existing.extend(lines)
             else:
-                # Add new section
-                print(f"  ↳ Adding section: [{section_name}]")
-                self.sections[section_name] = lines
-                # Copy type if exists
-                if section_name in self.section_types:
-                    self.section_types[section_name] = self.section_types[section_name]
+                # Add new section; its type was recorded while parsing
+                self._info(f"  ↳ Adding section: [{section_name}]")
+                sections[section_name] = lines
     
     def handle_inline_import(self, line: str):
         """Handle inline @DEVRC.IMPORT= statements within expressions"""
         # Parse: @DEVRC.IMPORT="./file.devrc" or @DEVRC.IMPORT="dirlist"
-        match = re.search(r'@DEVRC\.IMPORT="([^"]+)"', line)
+        match = _RE_INLINE_IMPORT.search(line)
         if match:
             import_ref = match.group(1)
-            print(f"✓ Inline import reference: {import_ref}")
+            self._info(f"✓ Inline import reference: {import_ref}")
             
             # Store as variable for later use
             if 'is STR' in line:
-                var_match = re.search(r'is STR "([^"]+)"', line)
+                var_match = _RE_VAR_STR.search(line)
                 if var_match:
                     var_name = var_match.group(1)
                     self.variables[var_name] = import_ref
-                    print(f"  ↳ Stored as: {var_name}")
+                    self._info(f"  ↳ Stored as: {var_name}")
     
     def handle_environment_activation(self, line: str):
         """Handle #[environmentname]/ACTIVATE directives"""
         # Parse: #[environmentname]/ACTIVATE
-        match = re.match(r'#\[([^\]]+)\]/ACTIVATE', line)
-        if not match:
-            print(f"✗ Invalid environment activation syntax: {line}")
+        close_idx = line.find(']')
+        if (close_idx <= 2 or not line.startswith('#[')
+                or not line.startswith('/ACTIVATE', close_idx + 1)):
+            self._log(f"✗ Invalid environment activation syntax: {line}")
             return
         
-        env_name = match.group(1)
+        env_name = line[2:close_idx]
         
         # Create environment directory path from root
         env_path = os.path.join(self.root_dir, env_name)
         
         # Create environment if it doesn't exist
-        if not os.path.exists(env_path):
-            try:
-                os.makedirs(env_path, exist_ok=True)
-                print(f"✓ Created environment directory: {env_path}")
-            except Exception as e:
-                print(f"✗ Failed to create environment directory: {e}")
-                return
+        try:
+            os.makedirs(env_path)
+            self._info(f"✓ Created environment directory: {env_path}")
+        except FileExistsError:
+            pass
+        except OSError as e:
+            self._log(f"✗ Failed to create environment directory: {e}")
+            return
         
         # Activate the environment
         self.active_environment = env_name
         self.environments[env_name] = {
             'path': env_path,
             'root': self.root_dir,
-            'activated_at': os.getcwd(),
+            'activated_at': self._cwd,
             'mode': 'SCRIPT',
             'exported': {},
             'subenv': {},
@@ -372,65 +382,81 @@ class DevRCInterpreter:
         self.variables['activate'] = f"{env_name}/ACTIVATE"
         self.variables['currentdir'] = env_path
         
-        # Change to environment directory
-        try:
-            os.chdir(env_path)
-            print(f"✓ Environment activated: {env_name}")
-            print(f"  ↳ Working directory: {env_path}")
-            print(f"  ↳ Root directory: {self.root_dir}")
-            print(f"  ↳ Mode: SCRIPT")
-        except Exception as e:
-            print(f"✗ Failed to change to environment directory: {e}")
+        # Resolve later relative paths inside the environment directory
+        if not os.path.isdir(env_path):
+            self._log(f"✗ Failed to change to environment directory: not a directory: {env_path}")
+            return
+        self._cwd = env_path
+        self._info(f"✓ Environment activated: {env_name}")
+        self._info(f"  ↳ Working directory: {env_path}")
+        self._info(f"  ↳ Root directory: {self.root_dir}")
+        self._info(f"  ↳ Mode: SCRIPT")
     
     def create_folder(self, path: str):
         """Create a folder if it doesn't exist"""
+        from pathlib import Path
+        
         path = path.strip('"').replace('*', '')
         try:
-            Path(path).mkdir(parents=True, exist_ok=True)
-            print(f"✓ Created folder: {path}")
+            Path(self._resolve(path)).mkdir(parents=True, exist_ok=True)
+            self._info(f"✓ Created folder: {path}")
         except Exception as e:
-            print(f"✗ Error creating folder {path}: {e}")
+            self._log(f"✗ Error creating folder {path}: {e}")
     
     def output_to_file(self, path: str, content: Any = None):
         """Handle output to file"""
+        from pathlib import Path
+        
         path = path.strip('"').replace('*', '')
+        target = Path(self._resolve(path))
         try:
             if '*' in path or path.endswith('/'):
                 # Directory output
-                Path(path).mkdir(parents=True, exist_ok=True)
-                print(f"✓ Prepared output directory: {path}")
+                target.mkdir(parents=True, exist_ok=True)
+                self._info(f"✓ Prepared output directory: {path}")
             else:
                 # File output
-                Path(path).parent.mkdir(parents=True, exist_ok=True)
+                target.parent.mkdir(parents=True, exist_ok=True)
                 if content:
-                    with open(path, 'w') as f:
+                    with open(target, 'w') as f:
                         if isinstance(content, dict):
+                            import json
                             json.dump(content, f, indent=2)
                         else:
                             f.write(str(content))
-                print(f"✓ Output to: {path}")
+                self._info(f"✓ Output to: {path}")
         except Exception as e:
-            print(f"✗ Error outputting to {path}: {e}")
+            self._log(f"✗ Error outputting to {path}: {e}")
     
     def execute_command(self, command: List[str]):
         """Execute a system command"""
+        import subprocess
+        
         try:
-            result = subprocess.run(command, capture_output=True, text=True)
-            print(f"✓ Executed: {' '.join(command)}")
+            result = subprocess.run(command, capture_output=True, text=True,
+                                    cwd=self._cwd)
+            self._info(f"✓ Executed: {' '.join(command)}")
             return result.stdout
         except Exception as e:
-            print(f"✗ Error executing command: {e}")
+            self._log(f"✗ Error executing command: {e}")
             return None
     
     def process_line(self, line: str):
         """Process a single line of DevRC code"""
-        tokens = self.tokenize(line)
-        if not tokens:
+        # Handlers rely on stripped lines; parsed and nested lines already are
+        try:
+            self._process_line(line.strip())
+        finally:
+            self._flush_log()
+    
+    def _process_line(self, line: str):
+        """Process a line without flushing the queued output"""
+        # Blank lines and comments never reach a handler
+        if not line or line[0] == '#':
             return
         
-        # Handle special comment directives (xcn-byp)
-        if line.strip().startswith('#xcn-byp'):
-            self.handle_xcn_bypass(line)
+        tokens = self.tokenize(line)
+        if not tokens:
             return
         
         # Handle assignments with special syntax
@@ -439,9 +465,9 @@ class DevRCInterpreter:
             var_name, var_value = assignment
             
             # Handle special assignments like poot={}
-            if var_value.strip() in ['{}', '[]']:
+            if var_value.strip() in _EMPTY_CONTAINERS:
                 self.variables[var_name] = {}
-                print(f"✓ Initialized {var_name} as empty container")
+                self._info(f"✓ Initialized {var_name} as empty container")
                 return
             
             # Handle complex assignments with try()
@@ -449,126 +475,57 @@ class DevRCInterpreter:
                 self.handle_try_assignment(var_name, var_value)
                 return
             
-            # Handle function assignments
-            if var_value.strip().startswith('function ('):
-                self.handle_function_assignment(var_name, var_value)
-                return
-            
             self.variables[var_name] = self.evaluate_expression(var_value)
-            print(f"✓ Set {var_name} = {self.variables[var_name]}")
-            return
-        
-        # Handle dirlist with -glob
-        if tokens[0] == 'dirlist' or 'dirlist=' in line:
-            self.handle_dirlist(line)
-            return
-        
-        # Handle currentdir
-        if tokens[0] == 'currentdir' or 'currentdir=' in line:
-            self.handle_currentdir(line)
-            return
-        
-        # Handle subenv
-        if tokens[0] == 'subenv' or 'subenv=' in line:
-            self.handle_subenv(line)
+            self._info(f"✓ Set {var_name} = {self.variables[var_name]}")
             return
         
-        # Handle prod/dev/debug environments
-        if tokens[0] in ['prod', 'dev', 'debug'] and '=' in line:
-            self.handle_environment_category(line)
+        # Keyword handlers that take the raw line
+        handler = self._head_dispatch.get(tokens[0])
+        if handler is not None:
+            handler(line)
             return
         
-        # Handle linenum
-        if tokens[0] == 'linenum' or 'linenum=' in line:
-            self.handle_linenum(line)
-            return
-        
-        # Handle current with activeline
-        if tokens[0] == 'current' or 'current=' in line:
-            self.handle_current_line(line)
-            return
-        
-        # Handle function definitions
-        if tokens[0] == 'function':
-            self.handle_function_definition(line)
-            return
-        
-        # Handle return statements
-        if tokens[0] == 'return':
-            self.handle_return_statement(line)
-            return
-        
-        # Handle export statements
-        if tokens[0] == 'export':
-            self.handle_export_statement(line)
-            return
-        
-        # Handle activate keyword
-        if tokens[0] == 'activate':
-            self.handle_activate_keyword(line)
-            return
-        
-        # Handle .devrc commands
-        if tokens[0] == '.devrc':
-            self.handle_devrc_command(tokens[1:])
-        
-        # Handle if statements
-        elif tokens[0] == 'if':
-            self.handle_if_statement(line)
-        
-        # Handle for loops
-        elif tokens[0] == 'for':
-            self.handle_for_loop(line)
-        
-        # Handle do statements
-        elif tokens[0] == 'do':
-            self.handle_do_statement(tokens[1:])
-        
-        # Handle out command
-        elif tokens[0] == 'out':
-            if len(tokens) > 1:
-                self.output_to_file(tokens[1])
-        
-        # Handle get operations
-        elif tokens[0] == 'get':
-            self.handle_get_operation(line)
-        
-        # Handle in operations  
-        elif tokens[0] == 'in':
-            self.handle_in_operation(line)
-        
-        # Handle try blocks
-        elif tokens[0] == 'try':
-            self.handle_try_block(line)
+        # Keyword handlers that take the remaining tokens
+        handler = self._token_dispatch.get(tokens[0])
+        if handler is not None:
+            handler(tokens[1:])
+    
+    def handle_out_command(self, tokens: List[str]):
+        """Handle out commands"""
+        if tokens:
+            self.output_to_file(tokens[0])
     
     def handle_function_definition(self, line: str):
         """Handle function definitions"""
-        match = re.search(r'function\s+(\w+)\s*\(', line)
+        # A named definition always has a '(' after the name
+        match = _RE_FUNC_DEF.search(line) if '(' in line else None
         if match:
             func_name = match.group(1)
-            print(f"✓ Function defined: {func_name}")
+            self._info(f"✓ Function defined: {func_name}")
             self.variables[func_name] = "function"
         else:
             # Anonymous function or function call syntax
-            print(f"✓ Function block defined")
+            self._info(f"✓ Function block defined")
     
     def handle_return_statement(self, line: str):
         """Handle return statements"""
         # Extract return value
-        match = re.search(r'return\s+(.+)', line)
+        match = _RE_RETURN.search(line)
         if match:
             return_val = match.group(1).strip()
-            print(f"✓ Return: {return_val}")
+            self._info(f"✓ Return: {return_val}")
             if self.active_environment:
                 self.environments[self.active_environment]['return_value'] = return_val
     
     def handle_export_statement(self, line: str):
         """Handle export statements for environment variables"""
         # Parse: export name ( ... )
-        match = re.search(r'export\s+(\w+)\s*\(', line)
+        if '(' not in line:
+            return
+        match = _RE_EXPORT.search(line)
         if match:
             export_name = match.group(1)
-            print(f"✓ Export: {export_name}")
+            self._info(f"✓ Export: {export_name}")
             
             if self.active_environment:
                 env_data = self.environments[self.active_environment]
@@ -585,110 +542,110 @@ class DevRCInterpreter:
     def handle_activate_keyword(self, line: str):
         """Handle activate= keyword for activation mode"""
         if '-mode SCRIPT' in line:
-            print(f"✓ Activate mode: SCRIPT")
+            self._info(f"✓ Activate mode: SCRIPT")
             if self.active_environment:
                 self.environments[self.active_environment]['mode'] = 'SCRIPT'
     
     def handle_bypass_export(self, line: str):
         """Handle bypass export for command execution"""
-        print(f"✓ Bypass export configured")
+        self._info(f"✓ Bypass export configured")
         
         # Extract file patterns
         if '.py' in line:
-            print(f"  ↳ Python file execution enabled")
+            self._info(f"  ↳ Python file execution enabled")
         if 'terminal' in line:
-            print(f"  ↳ Terminal mode enabled")
+            self._info(f"  ↳ Terminal mode enabled")
         if '-cmdbin' in line:
-            print(f"  ↳ Command binary mode enabled")
+            self._info(f"  ↳ Command binary mode enabled")
         if '-byp' in line:
-            print(f"  ↳ Bypass flag set")
+            self._info(f"  ↳ Bypass flag set")
     
     def handle_env_export(self, line: str):
         """Handle environment export"""
-        print(f"✓ Environment export configured")
+        self._info(f"✓ Environment export configured")
         if self.active_environment:
             env_name = self.active_environment
-            print(f"  ↳ Exporting environment: {env_name}")
+            self._info(f"  ↳ Exporting environment: {env_name}")
     
     def handle_try_block(self, line: str):
         """Handle try blocks"""
         # Extract content in try(...)
-        match = re.search(r'try\s*\((.+)\)', line, re.DOTALL)
-        if match:
-            try_content = match.group(1).strip()
-            print(f"✓ Try block: {try_content[:50]}...")
+        try_content = _try_body(line)
+        if try_content is not None:
+            try_content = try_content.strip()
+            self._info(f"✓ Try block: {try_content[:50]}...")
             # Process the content inside try
-            self.process_line(try_content)
+            self._process_line(try_content)
     
     def handle_try_assignment(self, var_name: str, var_value: str):
         """Handle assignments with try() blocks"""
-        match = re.search(r'try\s*\((.+)\)', var_value)
-        if match:
-            content = match.group(1).strip()
+        content = _try_body(var_value)
+        if content is not None:
+            content = content.strip()
             self.variables[var_name] = content
-            print(f"✓ Set {var_name} with try block: {content}")
+            self._info(f"✓ Set {var_name} with try block: {content}")
     
     def handle_dirlist(self, line: str):
         """Handle dirlist with -glob syntax"""
-        print(f"✓ Directory list operation")
+        self._info(f"✓ Directory list operation")
         
         # Extract glob pattern
         if '-glob default' in line:
-            print(f"  ↳ Using default glob pattern")
+            self._info(f"  ↳ Using default glob pattern")
         
         # Extract output
         if '-out' in line:
-            match = re.search(r'-out "([^"]+)"', line)
+            match = _RE_OUT.search(line)
             if match:
                 output = match.group(1)
-                print(f"  ↳ Output to: {output}")
+                self._info(f"  ↳ Output to: {output}")
         
         # Handle inline import
         if '@DEVRC.IMPORT=' in line:
-            print(f"  ↳ With import reference")
+            self._info(f"  ↳ With import reference")
         
         # Set variable
         self.variables['dirlist'] = "./"
         
     def handle_currentdir(self, line: str):
         """Handle currentdir = dirlist './' this.dir"""
-        print(f"✓ Current directory operation")
+        self._info(f"✓ Current directory operation")
         
         if 'this.dir' in line:
-            print(f"  ↳ Using this.dir reference")
+            self._info(f"  ↳ Using this.dir reference")
         
-        current_dir = self.variables.get('currentdir', os.getcwd())
+        current_dir = self.variables.get('currentdir', self._cwd)
         self.variables['currentdir'] = current_dir
-        print(f"  ↳ Current dir: {current_dir}")
+        self._info(f"  ↳ Current dir: {current_dir}")
     
     def handle_subenv(self, line: str):
         """Handle subenv = env.category"""
-        print(f"✓ Sub-environment configuration")
+        self._info(f"✓ Sub-environment configuration")
         
         if 'env.category' in line:
             if self.active_environment:
                 env_data = self.environments[self.active_environment]
                 env_data['subenv'] = {'category': 'default'}
-                print(f"  ↳ Sub-environment category set")
+                self._info(f"  ↳ Sub-environment category set")
     
     def handle_environment_category(self, line: str):
         """Handle prod/dev/debug environment categories"""
         # Parse: prod=drizzle[content+subenv=["debug","prod","dev"]]
-        match = re.match(r'(\w+)=(\w+)\[(.+)\]', line)
+        match = _RE_ENV_CAT.match(line)
         if match:
             category = match.group(1)
             env_name = match.group(2)
             content = match.group(3)
             
-            print(f"✓ Environment category: {category}")
-            print(f"  ↳ Environment: {env_name}")
+            self._info(f"✓ Environment category: {category}")
+            self._info(f"  ↳ Environment: {env_name}")
             
             # Parse subenv array
             if 'subenv=' in content:
-                subenv_match = re.search(r'subenv=\[([^\]]+)\]', content)
+                subenv_match = _RE_SUBENV.search(content)
                 if subenv_match:
                     subenvs = [s.strip('"') for s in subenv_match.group(1).split(',')]
-                    print(f"  ↳ Sub-environments: {', '.join(subenvs)}")
+                    self._info(f"  ↳ Sub-environments: {', '.join(subenvs)}")
                     
                     if self.active_environment:
                         env_data = self.environments[self.active_environment]
@@ -696,244 +653,205 @@ class DevRCInterpreter:
     
     def handle_linenum(self, line: str):
         """Handle linenum = this.lines.fetched (-out is numerics)"""
-        print(f"✓ Line number operation")
+        self._info(f"✓ Line number operation")
         
         if 'this.lines.fetched' in line:
-            print(f"  ↳ Fetching line numbers")
+            self._info(f"  ↳ Fetching line numbers")
         
         if '-out is numerics' in line:
-            print(f"  ↳ Output as numerics")
+            self._info(f"  ↳ Output as numerics")
         
         self.variables['linenum'] = 0
     
     def handle_current_line(self, line: str):
         """Handle current line with -activeline"""
-        print(f"✓ Current line operation")
+        self._info(f"✓ Current line operation")
         
         if '-linenum' in line:
-            print(f"  ↳ Using line numbers")
+            self._info(f"  ↳ Using line numbers")
         
         if '-getline' in line:
-            print(f"  ↳ Getting line content")
+            self._info(f"  ↳ Getting line content")
         
         if '-activeline' in line:
-            print(f"  ↳ Active line mode enabled")
+            self._info(f"  ↳ Active line mode enabled")
         
         if 'currentdir' in line:
-            print(f"  ↳ From current directory")
+            self._info(f"  ↳ From current directory")
         
         if 'get content[null]' in line:
-            print(f"  ↳ Getting null content")
+            self._info(f"  ↳ Getting null content")
     
     def handle_get_operation(self, line: str):
         """Handle get operations for fetching data"""
-        print(f"✓ Get operation")
+        # The marker scans below only produce status messages
+        if not self.verbose:
+            return
+        
+        self._info(f"✓ Get operation")
         
         # Handle table[content] access
         if 'table[content]' in line:
-            print(f"  ↳ Accessing table content")
+            self._info(f"  ↳ Accessing table content")
         
-        # Handle file operations
-        if 'file' in line and 'file_ext' in line:
-            print(f"  ↳ File retrieval operation")
+        # Handle file operations ('file_ext' implies 'file')
+        if 'file_ext' in line:
+            self._info(f"  ↳ File retrieval operation")
         
         # Handle content[null]
         if 'content[null]' in line:
-            print(f"  ↳ Accessing null content")
+            self._info(f"  ↳ Accessing null content")
         
         # Handle glob patterns
         if '-glob' in line:
-            print(f"  ↳ Using glob pattern")
+            self._info(f"  ↳ Using glob pattern")
     
     def handle_in_operation(self, line: str):
         """Handle in operations for context/scope"""
-        print(f"✓ In operation")
+        # The marker scans below only produce status messages
+        if not self.verbose:
+            return
+        
+        self._info(f"✓ In operation")
         
         # Handle env[activate] access
         if 'env[activate]' in line:
-            print(f"  ↳ Environment activation context")
+            self._info(f"  ↳ Environment activation context")
             if self.active_environment:
-                print(f"  ↳ Active environment: {self.active_environment}")
+                self._info(f"  ↳ Active environment: {self.active_environment}")
         
         # Handle env[content]
         if 'env[content]' in line:
-            print(f"  ↳ Environment content context")
+            self._info(f"  ↳ Environment content context")
         
         # Handle file is STR
         if 'file is STR' in line:
-            print(f"  ↳ File as string context")
+            self._info(f"  ↳ File as string context")
         
         # Handle -glob default
         if '-glob default' in line:
-            print(f"  ↳ Default glob pattern")
+            self._info(f"  ↳ Default glob pattern")
         
         # Handle this.* references
         if 'this.' in line:
-            this_ref = re.search(r'this\.(\w+)', line)
-            if this_ref:
-                print(f"  ↳ This reference: {this_ref.group(1)}")
+            if (this_ref := _RE_THIS.search(line)):
+                self._info(f"  ↳ This reference: {this_ref[1]}")
     
     def handle_devrc_command(self, tokens: List[str]):
         """Handle .devrc specific commands"""
+        flags_0arg = self._FLAGS_0ARG
+        flags_1arg = self._FLAGS_1ARG
+        n = len(tokens)
         i = 0
-        while i < len(tokens):
+        while i < n:
             token = tokens[i]
             
-            if token == '-out' and i + 1 < len(tokens):
-                self.output_to_file(tokens[i + 1])
-                i += 2
-            
-            elif token == '-crfolder' and i + 1 < len(tokens):
-                self.create_folder(tokens[i + 1])
-                i += 2
-            
-            elif token == '-pop':
-                if i + 1 < len(tokens):
-                    print(f"✓ Pop operation: {tokens[i + 1]}")
-                i += 2
-            
-            elif token == '-plugin':
-                print("✓ Plugin mode enabled")
-                i += 1
-            
-            elif token == '-config':
-                print("✓ Config mode enabled")
-                i += 1
-            
-            elif token == '-c':
-                print("✓ Compile mode enabled")
-                i += 1
-            
-            elif token == '-timed':
-                print("✓ Timed operation enabled")
-                i += 1
-            
-            elif token == '-mode' and i + 1 < len(tokens):
-                print(f"✓ Mode set to: {tokens[i + 1]}")
-                i += 2
-            
-            elif token == '-force':
-                print("✓ Force mode enabled")
-                i += 1
-            
-            elif token == '-a':
-                print("✓ Append operation")
-                i += 1
-            
-            elif token == '-locate' and i + 1 < len(tokens):
-                print(f"✓ Locate: {tokens[i + 1]}")
-                i += 2
-            
-            elif token == '-to':
-                print("✓ Transform operation")
-                i += 1
-            
-            elif token == '-ext' and i + 1 < len(tokens):
-                print(f"✓ Extension: {tokens[i + 1]}")
-                i += 2
-            
-            elif token == '-cmdbin':
-                print("✓ Command binary mode")
-                i += 1
-            
-            elif token == '-cmdline':
-                print("✓ Command line mode")
-                i += 1
-            
-            elif token == '-rline' and i + 1 < len(tokens):
-                print(f"✓ Run line: {tokens[i + 1]}")
-                i += 2
-            
-            elif token == '-r' and i + 1 < len(tokens):
-                print(f"✓ Run mode: {tokens[i + 1]}")
-                i += 2
-            
-            elif token == '-byp':
-                print("✓ Bypass mode enabled")
-                i += 1
-            
-            elif token == '-h' and i + 1 < len(tokens):
-                print(f"✓ Handle pattern: {tokens[i + 1]}")
-                i += 2
-            
-            elif token == '-ch':
-                print("✓ Chain operation")
-                i += 1
-            
-            elif token == '-numline':
-                print("✓ Number line mode")
-                i += 1
-            
-            elif token == '-ff':
-                print("✓ Fast forward mode")
+            # Every flag starts with '-'; skip plain words outright
+            if not token or token[0] != '-':
                 i += 1
+                continue
             
-            else:
-                i += 1
+            # Flags taking an argument only apply when one follows
+            if i + 1 < n:
+                if token == '-out':
+                    self.output_to_file(tokens[i + 1])
+                    i += 2
+                    continue
+                if token == '-crfolder':
+                    self.create_folder(tokens[i + 1])
+                    i += 2
+                    continue
+                msg = flags_1arg.get(token)
+                if msg is not None:
+                    self._info(msg + tokens[i + 1])
+                    i += 2
+                    continue
+            
+            msg = flags_0arg.get(token)
+            if msg is not None:
+                self._info(msg)
+            i += 1
     
     def handle_if_statement(self, line: str):
         """Handle if statements"""
-        # Extract condition
-        match = re.search(r'if \((.*?)\) is (.*?)(?:\s+do\s+|\s+|$)', line)
-        if match:
-            var_name = match.group(1).strip()
-            expected = match.group(2).strip()
+        # Extract condition; the pattern cannot match without ") is "
+        if ') is ' not in line:
+            return
+        # The split is cached per line; the comparison reads current variables
+        parsed = _parse_if(line)
+        if parsed:
+            var_name, expected, rest = parsed
             
             var_value = self.variables.get(var_name, False)
             expected_value = self.evaluate_expression(expected)
             
             if var_value == expected_value:
                 # Execute the rest of the line
-                rest = line[match.end():].strip()
                 if rest:
-                    print(f"✓ Condition met: {var_name} is {expected_value}")
-                    self.process_line(rest)
+                    self._info(f"✓ Condition met: {var_name} is {expected_value}")
+                    self._process_line(rest)
             else:
-                print(f"✗ Condition not met: {var_name} is not {expected_value}")
+                self._info(f"✗ Condition not met: {var_name} is not {expected_value}")
     
     def handle_for_loop(self, line: str):
         """Handle for loops"""
-        match = re.search(r'for \((.*?)\)', line)
-        if match:
-            var_name = match.group(1).strip()
-            print(f"✓ For loop over: {var_name}")
+        # Dispatched lines start with 'for', so the pattern is anchored
+        if (match := _RE_FOR.match(line)):
+            var_name = match[1].strip()
+            self._info(f"✓ For loop over: {var_name}")
             # Execute the rest of the line
             rest = line[match.end():].strip()
             if rest:
-                self.process_line(rest)
+                self._process_line(rest)
     
     def handle_do_statement(self, tokens: List[str]):
         """Handle do statements"""
-        print(f"✓ Do statement: {' '.join(tokens)}")
+        self._info(f"✓ Do statement: {' '.join(tokens)}")
         self.handle_devrc_command(tokens)
     
     def execute_section(self, section_name: str):
         """Execute a specific section"""
         if section_name not in self.sections:
-            print(f"✗ Section not found: {section_name}")
+            self._log(f"✗ Section not found: {section_name}")
             return
         
-        section_type = self.section_types.get(section_name, "untyped")
-        print(f"\n=== Executing section: {section_name} @[{section_type}] ===")
-        for line in self.sections[section_name]:
-            self.process_line(line)
+        self._execute_lines(section_name, self.sections[section_name])
     
     def execute_all(self):
         """Execute all sections in order"""
         for section_name, lines in self.sections.items():
-            self.execute_section(section_name)
+            self._execute_lines(section_name, lines)
+    
+    def _execute_lines(self, section_name: str, lines: List[str]):
+        """Print the section header and run each of its lines"""
+        section_type = self.section_types.get(section_name, "untyped")
+        self._log(f"\n=== Executing section: {section_name} @[{section_type}] ===")
+        # Output is written once per section rather than once per line
+        process = self._process_line
+        try:
+            for line in lines:
+                process(line)
+        finally:
+            self._flush_log()
     
     def run(self, filepath: str, sections: Optional[List[str]] = None):
         """Run the DevRC interpreter"""
-        print(f"DevRC Interpreter - Loading {filepath}")
-        print(f"Root directory: {self.root_dir}")
+        self._log(f"DevRC Interpreter - Loading {filepath}")
+        self._log(f"Root directory: {self.root_dir}")
         
-        self.sections = self.parse_file(filepath)
+        # Reuse sections a caller just parsed from this same file
+        abs_path = os.path.abspath(self._resolve(filepath))
+        if self._parsed and self._parsed[0] == abs_path:
+            self.sections = self._parsed[1]
+        else:
+            self.sections = self.parse_file(filepath)
+        # Use the entry once; a later run parses again to redo activation
+        self._parsed = None
         
-        print(f"\n✓ Total sections loaded: {len(self.sections)}")
-        print(f"✓ Total imports processed: {len(self.imported_files)}")
+        self._log(f"\n✓ Total sections loaded: {len(self.sections)}")
+        self._log(f"✓ Total imports processed: {len(self.imported_files)}")
         if self.active_environment:
-            print(f"✓ Active environment: {self.active_environment}")
+            self._log(f"✓ Active environment: {self.active_environment}")
         
         if sections:
             for section in sections:
@@ -941,23 +859,25 @@ class DevRCInterpreter:
         else:
             self.execute_all()
         
-        print("\n=== Execution complete ===")
+        self._log("\n=== Execution complete ===")
         if self.imported_files:
-            print(f"Imported files:")
+            self._log(f"Imported files:")
             for imp in self.imported_files:
-                print(f"  - {imp}")
+                self._log(f"  - {imp}")
         
         if self.environments:
-            print(f"\nEnvironments:")
+            self._log(f"\nEnvironments:")
             for env_name, env_info in self.environments.items():
                 active = " (active)" if env_name == self.active_environment else ""
-                print(f"  - {env_name}{active}")
-                print(f"    Path: {env_info['path']}")
+                self._log(f"  - {env_name}{active}")
+                self._log(f"    Path: {env_info['path']}")
         
         # Return to root directory after execution
         if self.active_environment:
-            os.chdir(self.root_dir)
-            print(f"\n✓ Returned to root directory: {self.root_dir}")
+            self._cwd = self.root_dir
+            self._log(f"\n✓ Returned to root directory: {self.root_dir}")
+        
+        self._flush_log()
 
 
 def main():
@@ -973,10 +893,13 @@ def main():
                        help='Set root directory for environments (default: current directory)')
     parser.add_argument('--list-envs', action='store_true',
                        help='List all available environments')
+    parser.add_argument('--quiet', '-q', action='store_true',
+                       help='Only report errors and the run summary')
     
     args = parser.parse_args()
     
     interpreter = DevRCInterpreter()
+    interpreter.verbose = not args.quiet
     
     # Set custom root if provided
     if args.root:
@@ -985,968 +908,28 @@ def main():
     
     if args.dry_run:
         sections = interpreter.parse_file(args.file)
-        print("Parsed sections:")
+        section_types = interpreter.section_types
+        out = ["Parsed sections:"]
         for name, lines in sections.items():
-            section_type = interpreter.section_types.get(name, "untyped")
-            print(f"\n@[{section_type}]")
-            print(f"[{name}]")
-            for line in lines:
-                print(f"  {line}")
+            out.append(f"\n@[{section_types.get(name, 'untyped')}]")
+            out.append(f"[{name}]")
+            out.extend(f"  {line}" for line in lines)
         
         if interpreter.environments:
-            print("\n\nEnvironments found:")
+            out.append("\n\nEnvironments found:")
             for env_name, env_info in interpreter.environments.items():
-                print(f"  - {env_name}: {env_info['path']}")
-    
-    elif args.list_envs:
-        # Scan for environment directories in root
-        print(f"Scanning for environments in: {interpreter.root_dir}")
-        if os.path.exists(interpreter.root_dir):
-            for item in os.listdir(interpreter.root_dir):
-                item_path = os.path.join(interpreter.root_dir, item)
-                if os.path.isdir(item_path):
-                    print(f"  - {item}")
-    
-    else:
-        interpreter.run(args.file, args.section)
-
-
-if __name__ == '__main__':
-    main()            elif token == '-cmdline':
-                print("✓ Command line mode")
-                i += 1
-            
-            elif token == '-rline' and i + 1 < len(tokens):
-                print(f"✓ Run line: {tokens[i + 1]}")
-                i += 2
-            
-            elif token == '-r' and i + 1 < len(tokens):
-                print(f"✓ Run mode: {tokens[i + 1]}")
-                i += 2
-            
-            elif token == '-byp':
-                print("✓ Bypass mode enabled")
-                i += 1
-            
-            elif token == '-h' and i + 1 < len(tokens):
-                print(f"✓ Handle pattern: {tokens[i + 1]}")
-                i += 2
-            
-            elif token == '-ch':
-                print("✓ Chain operation")
-                i += 1
-            
-            elif token == '-numline':
-                print("✓ Number line mode")
-                i += 1
-            
-            elif token == '-ff':
-                print("✓ Fast forward mode")
-                i += 1
-            
-            elif token == '-glob' and i + 1 < len(tokens):
-                print(f"✓ Glob pattern: {tokens[i + 1]}")
-                i += 2
-            
-            elif token == '-set':
-                print("✓ Set operation")
-                i += 1
-            
-            elif token == '-getline':
-                print("✓ Get line operation")
-                i += 1
-            
-            elif token == '-linenum':
-                print("✓ Line number operation")
-                i += 1
-            
-            elif token == '-activeline':
-                print("✓ Active line mode")
-                i += 1
-            
-            elif token == '-enable':
-                print("✓ Enable flag")
-                i += 1
-            
-            elif token == '-commitline':
-                print("✓ Commit line operation")
-                i += 1
-            
-            else:
-                i += 1#!/usr/bin/env python3
-"""
-DevRC DSL Interpreter
-Parses and executes .devrc configuration files
-"""
-
-import re
-import os
-import json
-import subprocess
-from pathlib import Path
-from typing import Dict, List, Any, Optional
-
-
-class DevRCInterpreter:
-    def __init__(self):
-        self.variables = {}
-        self.sections = {}
-        self.section_types = {}
-        self.current_section = None
-        self.imported_files = set()
-        self.import_stack = []
-        self.environments = {}
-        self.active_environment = None
-        self.root_dir = os.getcwd()
-        
-    def parse_file(self, filepath: str) -> Dict[str, List[str]]:
-        """Parse a .devrc file into sections"""
-        # Prevent circular imports
-        abs_path = os.path.abspath(filepath)
-        if abs_path in self.import_stack:
-            print(f"✗ Circular import detected: {filepath}")
-            return {}
-        
-        self.import_stack.append(abs_path)
-        
-        with open(filepath, 'r') as f:
-            content = f.read()
-        
-        sections = {}
-        current_section = None
-        current_type = None
+                out.append(f"  - {env_name}: {env_info['path']}")
         
-        for line in content.split('\n'):
-            original_line = line
-            
-            # Check for environment activation BEFORE removing comments
-            if line.strip().startswith('#[') and ']/ACTIVATE' in line:
-                self.handle_environment_activation(line.strip())
-                continue
-            
-            # Check for inline imports with @DEVRC.IMPORT=
-            if '@DEVRC.IMPORT=' in line:
-                self.handle_inline_import(line)
-                # Don't skip the line, let it be processed
-            
-            # Remove comments (but not environment markers)
-            if '#' in line and not line.strip().startswith('#['):
-                line = line.split('#')[0]
-            
-            line = line.strip()
-            if not line:
-                continue
-            
-            # Check for imports
-            if line.startswith('@DEVRC.IMPORT.'):
-                self.handle_import(line, os.path.dirname(filepath))
-                continue
-            
-            # Check for type annotations
-            if line.startswith('@[') and line.endswith(']'):
-                current_type = line[2:-1]
-                print(f"✓ Type annotation found: {current_type}")
-                continue
-                
-            # Check for section headers
-            if line.startswith('[') and line.endswith(']'):
-                current_section = line[1:-1]
-                sections[current_section] = []
-                if current_type:
-                    self.section_types[current_section] = current_type
-                    current_type = None
-            elif current_section:
-                sections[current_section].append(line)
-        
-        self.import_stack.pop()
-        return sections
-    
-    def tokenize(self, line: str) -> List[str]:
-        """Tokenize a line into components"""
-        # Handle quoted strings
-        tokens = []
-        current = []
-        in_quotes = False
-        
-        for char in line:
-            if char == '"':
-                in_quotes = not in_quotes
-                current.append(char)
-            elif char in [' ', '\t'] and not in_quotes:
-                if current:
-                    tokens.append(''.join(current))
-                    current = []
-            else:
-                current.append(char)
-        
-        if current:
-            tokens.append(''.join(current))
-        
-        return tokens
-    
-    def parse_assignment(self, line: str) -> Optional[tuple]:
-        """Parse variable assignment"""
-        if '=' in line:
-            parts = line.split('=', 1)
-            var_name = parts[0].strip()
-            var_value = parts[1].strip()
-            return (var_name, var_value)
-        return None
-    
-    def evaluate_expression(self, expr: str) -> Any:
-        """Evaluate an expression"""
-        expr = expr.strip()
-        
-        # Remove quotes
-        if expr.startswith('"') and expr.endswith('"'):
-            return expr[1:-1]
-        
-        # Check if it's a variable reference
-        if expr in self.variables:
-            return self.variables[expr]
-        
-        # Check for boolean literals
-        if expr.lower() in ['true', '-true']:
-            return True
-        if expr.lower() in ['false', '-false']:
-            return False
-        
-        # Check for null
-        if expr.lower() == 'null':
-            return None
-        
-        return expr
-    
-    def handle_import(self, line: str, base_path: str):
-        """Handle @DEVRC.IMPORT.[variablename] statements"""
-        # Parse import statement: @DEVRC.IMPORT.[variablename] or @DEVRC.IMPORT.[variablename]="path"
-        match = re.match(r'@DEVRC\.IMPORT\.(\w+)(?:="?([^"]+)"?)?', line)
-        if not match:
-            print(f"✗ Invalid import syntax: {line}")
-            return
-        
-        var_name = match.group(1)
-        import_path = match.group(2)
-        
-        # If no path specified, check if variable exists
-        if not import_path:
-            if var_name not in self.variables:
-                print(f"✗ Import failed: variable '{var_name}' not defined")
-                return
-            import_path = self.variables[var_name]
-        
-        # Resolve relative paths
-        if not os.path.isabs(import_path):
-            import_path = os.path.join(base_path, import_path)
-        
-        # Check if already imported
-        abs_import_path = os.path.abspath(import_path)
-        if abs_import_path in self.imported_files:
-            print(f"✓ Already imported: {import_path}")
-            return
-        
-        # Check if file exists
-        if not os.path.exists(import_path):
-            print(f"✗ Import file not found: {import_path}")
-            return
-        
-        print(f"✓ Importing from: {import_path}")
-        self.imported_files.add(abs_import_path)
-        
-        # Parse and merge the imported file
-        imported_sections = self.parse_file(import_path)
-        for section_name, lines in imported_sections.items():
-            if section_name in self.sections:
-                # Merge with existing section
-                print(f"  ↳ Merging section: [{section_name}]")
-                self.sections[section_name].extend(lines)
-            else:
-                # Add new section
-                print(f"  ↳ Adding section: [{section_name}]")
-                self.sections[section_name] = lines
-                # Copy type if exists
-                if section_name in self.section_types:
-                    self.section_types[section_name] = self.section_types[section_name]
-    
-    def handle_inline_import(self, line: str):
-        """Handle inline @DEVRC.IMPORT= statements within expressions"""
-        # Parse: @DEVRC.IMPORT="./file.devrc" or @DEVRC.IMPORT="dirlist"
-        match = re.search(r'@DEVRC\.IMPORT="([^"]+)"', line)
-        if match:
-            import_ref = match.group(1)
-            print(f"✓ Inline import reference: {import_ref}")
-            
-            # Store as variable for later use
-            if 'is STR' in line:
-                var_match = re.search(r'is STR "([^"]+)"', line)
-                if var_match:
-                    var_name = var_match.group(1)
-                    self.variables[var_name] = import_ref
-                    print(f"  ↳ Stored as: {var_name}")
-    
-    def handle_environment_activation(self, line: str):
-        """Handle #[environmentname]/ACTIVATE directives"""
-        # Parse: #[environmentname]/ACTIVATE
-        match = re.match(r'#\[([^\]]+)\]/ACTIVATE', line)
-        if not match:
-            print(f"✗ Invalid environment activation syntax: {line}")
-            return
-        
-        env_name = match.group(1)
-        
-        # Create environment directory path from root
-        env_path = os.path.join(self.root_dir, env_name)
-        
-        # Create environment if it doesn't exist
-        if not os.path.exists(env_path):
-            try:
-                os.makedirs(env_path, exist_ok=True)
-                print(f"✓ Created environment directory: {env_path}")
-            except Exception as e:
-                print(f"✗ Failed to create environment directory: {e}")
-                return
-        
-        # Activate the environment
-        self.active_environment = env_name
-        self.environments[env_name] = {
-            'path': env_path,
-            'root': self.root_dir,
-            'activated_at': os.getcwd(),
-            'mode': 'SCRIPT',
-            'exported': {},
-            'subenv': {},
-            'content': {}
-        }
-        
-        # Set environment variable
-        self.variables['env'] = env_name
-        self.variables['activate'] = f"{env_name}/ACTIVATE"
-        self.variables['currentdir'] = env_path
-        
-        # Change to environment directory
-        try:
-            os.chdir(env_path)
-            print(f"✓ Environment activated: {env_name}")
-            print(f"  ↳ Working directory: {env_path}")
-            print(f"  ↳ Root directory: {self.root_dir}")
-            print(f"  ↳ Mode: SCRIPT")
-        except Exception as e:
-            print(f"✗ Failed to change to environment directory: {e}")
-    
-    def create_folder(self, path: str):
-        """Create a folder if it doesn't exist"""
-        path = path.strip('"').replace('*', '')
-        try:
-            Path(path).mkdir(parents=True, exist_ok=True)
-            print(f"✓ Created folder: {path}")
-        except Exception as e:
-            print(f"✗ Error creating folder {path}: {e}")
-    
-    def output_to_file(self, path: str, content: Any = None):
-        """Handle output to file"""
-        path = path.strip('"').replace('*', '')
-        try:
-            if '*' in path or path.endswith('/'):
-                # Directory output
-                Path(path).mkdir(parents=True, exist_ok=True)
-                print(f"✓ Prepared output directory: {path}")
-            else:
-                # File output
-                Path(path).parent.mkdir(parents=True, exist_ok=True)
-                if content:
-                    with open(path, 'w') as f:
-                        if isinstance(content, dict):
-                            json.dump(content, f, indent=2)
-                        else:
-                            f.write(str(content))
-                print(f"✓ Output to: {path}")
-        except Exception as e:
-            print(f"✗ Error outputting to {path}: {e}")
-    
-    def execute_command(self, command: List[str]):
-        """Execute a system command"""
-        try:
-            result = subprocess.run(command, capture_output=True, text=True)
-            print(f"✓ Executed: {' '.join(command)}")
-            return result.stdout
-        except Exception as e:
-            print(f"✗ Error executing command: {e}")
-            return None
-    
-    def process_line(self, line: str):
-        """Process a single line of DevRC code"""
-        tokens = self.tokenize(line)
-        if not tokens:
-            return
-        
-        # Handle assignments with special syntax
-        assignment = self.parse_assignment(line)
-        if assignment:
-            var_name, var_value = assignment
-            
-            # Handle special assignments like poot={}
-            if var_value.strip() in ['{}', '[]']:
-                self.variables[var_name] = {}
-                print(f"✓ Initialized {var_name} as empty container")
-                return
-            
-            # Handle complex assignments with try()
-            if 'try (' in var_value:
-                self.handle_try_assignment(var_name, var_value)
-                return
-            
-            self.variables[var_name] = self.evaluate_expression(var_value)
-            print(f"✓ Set {var_name} = {self.variables[var_name]}")
-            return
-        
-        # Handle dirlist with -glob
-        if tokens[0] == 'dirlist' or 'dirlist=' in line:
-            self.handle_dirlist(line)
-            return
-        
-        # Handle currentdir
-        if tokens[0] == 'currentdir' or 'currentdir=' in line:
-            self.handle_currentdir(line)
-            return
-        
-        # Handle subenv
-        if tokens[0] == 'subenv' or 'subenv=' in line:
-            self.handle_subenv(line)
-            return
-        
-        # Handle prod/dev/debug environments
-        if tokens[0] in ['prod', 'dev', 'debug'] and '=' in line:
-            self.handle_environment_category(line)
-            return
-        
-        # Handle linenum
-        if tokens[0] == 'linenum' or 'linenum=' in line:
-            self.handle_linenum(line)
-            return
-        
-        # Handle current with activeline
-        if tokens[0] == 'current' or 'current=' in line:
-            self.handle_current_line(line)
-            return
-        
-        # Handle function definitions
-        if tokens[0] == 'function':
-            self.handle_function_definition(line)
-            return
-        
-        # Handle return statements
-        if tokens[0] == 'return':
-            self.handle_return_statement(line)
-            return
-        
-        # Handle export statements
-        if tokens[0] == 'export':
-            self.handle_export_statement(line)
-            return
-        
-        # Handle activate keyword
-        if tokens[0] == 'activate':
-            self.handle_activate_keyword(line)
-            return
-        
-        # Handle .devrc commands
-        if tokens[0] == '.devrc':
-            self.handle_devrc_command(tokens[1:])
-        
-        # Handle if statements
-        elif tokens[0] == 'if':
-            self.handle_if_statement(line)
-        
-        # Handle for loops
-        elif tokens[0] == 'for':
-            self.handle_for_loop(line)
-        
-        # Handle do statements
-        elif tokens[0] == 'do':
-            self.handle_do_statement(tokens[1:])
-        
-        # Handle out command
-        elif tokens[0] == 'out':
-            if len(tokens) > 1:
-                self.output_to_file(tokens[1])
-        
-        # Handle get operations
-        elif tokens[0] == 'get':
-            self.handle_get_operation(line)
-        
-        # Handle in operations  
-        elif tokens[0] == 'in':
-            self.handle_in_operation(line)
-        
-        # Handle try blocks
-        elif tokens[0] == 'try':
-            self.handle_try_block(line)
-    
-    def handle_function_definition(self, line: str):
-        """Handle function definitions"""
-        match = re.search(r'function\s+(\w+)\s*\(', line)
-        if match:
-            func_name = match.group(1)
-            print(f"✓ Function defined: {func_name}")
-            self.variables[func_name] = "function"
-        else:
-            # Anonymous function or function call syntax
-            print(f"✓ Function block defined")
-    
-    def handle_return_statement(self, line: str):
-        """Handle return statements"""
-        # Extract return value
-        match = re.search(r'return\s+(.+)', line)
-        if match:
-            return_val = match.group(1).strip()
-            print(f"✓ Return: {return_val}")
-            if self.active_environment:
-                self.environments[self.active_environment]['return_value'] = return_val
-    
-    def handle_export_statement(self, line: str):
-        """Handle export statements for environment variables"""
-        # Parse: export name ( ... )
-        match = re.search(r'export\s+(\w+)\s*\(', line)
-        if match:
-            export_name = match.group(1)
-            print(f"✓ Export: {export_name}")
-            
-            if self.active_environment:
-                env_data = self.environments[self.active_environment]
-                if 'exported' not in env_data:
-                    env_data['exported'] = {}
-                env_data['exported'][export_name] = line
-                
-                # Handle special exports
-                if export_name == 'byp':
-                    self.handle_bypass_export(line)
-                elif export_name == 'env':
-                    self.handle_env_export(line)
-    
-    def handle_activate_keyword(self, line: str):
-        """Handle activate= keyword for activation mode"""
-        if '-mode SCRIPT' in line:
-            print(f"✓ Activate mode: SCRIPT")
-            if self.active_environment:
-                self.environments[self.active_environment]['mode'] = 'SCRIPT'
-    
-    def handle_bypass_export(self, line: str):
-        """Handle bypass export for command execution"""
-        print(f"✓ Bypass export configured")
-        
-        # Extract file patterns
-        if '.py' in line:
-            print(f"  ↳ Python file execution enabled")
-        if 'terminal' in line:
-            print(f"  ↳ Terminal mode enabled")
-        if '-cmdbin' in line:
-            print(f"  ↳ Command binary mode enabled")
-        if '-byp' in line:
-            print(f"  ↳ Bypass flag set")
-    
-    def handle_env_export(self, line: str):
-        """Handle environment export"""
-        print(f"✓ Environment export configured")
-        if self.active_environment:
-            env_name = self.active_environment
-            print(f"  ↳ Exporting environment: {env_name}")
-    
-    def handle_try_block(self, line: str):
-        """Handle try blocks"""
-        # Extract content in try(...)
-        match = re.search(r'try\s*\((.+)\)', line, re.DOTALL)
-        if match:
-            try_content = match.group(1).strip()
-            print(f"✓ Try block: {try_content[:50]}...")
-            # Process the content inside try
-            self.process_line(try_content)
-    
-    def handle_try_assignment(self, var_name: str, var_value: str):
-        """Handle assignments with try() blocks"""
-        match = re.search(r'try\s*\((.+)\)', var_value)
-        if match:
-            content = match.group(1).strip()
-            self.variables[var_name] = content
-            print(f"✓ Set {var_name} with try block: {content}")
-    
-    def handle_dirlist(self, line: str):
-        """Handle dirlist with -glob syntax"""
-        print(f"✓ Directory list operation")
-        
-        # Extract glob pattern
-        if '-glob default' in line:
-            print(f"  ↳ Using default glob pattern")
-        
-        # Extract output
-        if '-out' in line:
-            match = re.search(r'-out "([^"]+)"', line)
-            if match:
-                output = match.group(1)
-                print(f"  ↳ Output to: {output}")
-        
-        # Handle inline import
-        if '@DEVRC.IMPORT=' in line:
-            print(f"  ↳ With import reference")
-        
-        # Set variable
-        self.variables['dirlist'] = "./"
-        
-    def handle_currentdir(self, line: str):
-        """Handle currentdir = dirlist './' this.dir"""
-        print(f"✓ Current directory operation")
-        
-        if 'this.dir' in line:
-            print(f"  ↳ Using this.dir reference")
-        
-        current_dir = self.variables.get('currentdir', os.getcwd())
-        self.variables['currentdir'] = current_dir
-        print(f"  ↳ Current dir: {current_dir}")
-    
-    def handle_subenv(self, line: str):
-        """Handle subenv = env.category"""
-        print(f"✓ Sub-environment configuration")
-        
-        if 'env.category' in line:
-            if self.active_environment:
-                env_data = self.environments[self.active_environment]
-                env_data['subenv'] = {'category': 'default'}
-                print(f"  ↳ Sub-environment category set")
-    
-    def handle_environment_category(self, line: str):
-        """Handle prod/dev/debug environment categories"""
-        # Parse: prod=drizzle[content+subenv=["debug","prod","dev"]]
-        match = re.match(r'(\w+)=(\w+)\[(.+)\]', line)
-        if match:
-            category = match.group(1)
-            env_name = match.group(2)
-            content = match.group(3)
-            
-            print(f"✓ Environment category: {category}")
-            print(f"  ↳ Environment: {env_name}")
-            
-            # Parse subenv array
-            if 'subenv=' in content:
-                subenv_match = re.search(r'subenv=\[([^\]]+)\]', content)
-                if subenv_match:
-                    subenvs = [s.strip('"') for s in subenv_match.group(1).split(',')]
-                    print(f"  ↳ Sub-environments: {', '.join(subenvs)}")
-                    
-                    if self.active_environment:
-                        env_data = self.environments[self.active_environment]
-                        env_data['categories'] = subenvs
-    
-    def handle_linenum(self, line: str):
-        """Handle linenum = this.lines.fetched (-out is numerics)"""
-        print(f"✓ Line number operation")
-        
-        if 'this.lines.fetched' in line:
-            print(f"  ↳ Fetching line numbers")
-        
-        if '-out is numerics' in line:
-            print(f"  ↳ Output as numerics")
-        
-        self.variables['linenum'] = 0
-    
-    def handle_current_line(self, line: str):
-        """Handle current line with -activeline"""
-        print(f"✓ Current line operation")
-        
-        if '-linenum' in line:
-            print(f"  ↳ Using line numbers")
-        
-        if '-getline' in line:
-            print(f"  ↳ Getting line content")
-        
-        if '-activeline' in line:
-            print(f"  ↳ Active line mode enabled")
-        
-        if 'currentdir' in line:
-            print(f"  ↳ From current directory")
-        
-        if 'get content[null]' in line:
-            print(f"  ↳ Getting null content")
-    
-    def handle_get_operation(self, line: str):
-        """Handle get operations for fetching data"""
-        print(f"✓ Get operation")
-        
-        # Handle table[content] access
-        if 'table[content]' in line:
-            print(f"  ↳ Accessing table content")
-        
-        # Handle file operations
-        if 'file' in line and 'file_ext' in line:
-            print(f"  ↳ File retrieval operation")
-        
-        # Handle content[null]
-        if 'content[null]' in line:
-            print(f"  ↳ Accessing null content")
-        
-        # Handle glob patterns
-        if '-glob' in line:
-            print(f"  ↳ Using glob pattern")
-    
-    def handle_in_operation(self, line: str):
-        """Handle in operations for context/scope"""
-        print(f"✓ In operation")
-        
-        # Handle env[activate] access
-        if 'env[activate]' in line:
-            print(f"  ↳ Environment activation context")
-            if self.active_environment:
-                print(f"  ↳ Active environment: {self.active_environment}")
-        
-        # Handle env[content]
-        if 'env[content]' in line:
-            print(f"  ↳ Environment content context")
-        
-        # Handle file is STR
-        if 'file is STR' in line:
-            print(f"  ↳ File as string context")
-        
-        # Handle -glob default
-        if '-glob default' in line:
-            print(f"  ↳ Default glob pattern")
-        
-        # Handle this.* references
-        if 'this.' in line:
-            this_ref = re.search(r'this\.(\w+)', line)
-            if this_ref:
-                print(f"  ↳ This reference: {this_ref.group(1)}")
-    
-    def handle_devrc_command(self, tokens: List[str]):
-        """Handle .devrc specific commands"""
-        i = 0
-        while i < len(tokens):
-            token = tokens[i]
-            
-            if token == '-out' and i + 1 < len(tokens):
-                self.output_to_file(tokens[i + 1])
-                i += 2
-            
-            elif token == '-crfolder' and i + 1 < len(tokens):
-                self.create_folder(tokens[i + 1])
-                i += 2
-            
-            elif token == '-pop':
-                if i + 1 < len(tokens):
-                    print(f"✓ Pop operation: {tokens[i + 1]}")
-                i += 2
-            
-            elif token == '-plugin':
-                print("✓ Plugin mode enabled")
-                i += 1
-            
-            elif token == '-config':
-                print("✓ Config mode enabled")
-                i += 1
-            
-            elif token == '-c':
-                print("✓ Compile mode enabled")
-                i += 1
-            
-            elif token == '-timed':
-                print("✓ Timed operation enabled")
-                i += 1
-            
-            elif token == '-mode' and i + 1 < len(tokens):
-                print(f"✓ Mode set to: {tokens[i + 1]}")
-                i += 2
-            
-            elif token == '-force':
-                print("✓ Force mode enabled")
-                i += 1
-            
-            elif token == '-a':
-                print("✓ Append operation")
-                i += 1
-            
-            elif token == '-locate' and i + 1 < len(tokens):
-                print(f"✓ Locate: {tokens[i + 1]}")
-                i += 2
-            
-            elif token == '-to':
-                print("✓ Transform operation")
-                i += 1
-            
-            elif token == '-ext' and i + 1 < len(tokens):
-                print(f"✓ Extension: {tokens[i + 1]}")
-                i += 2
-            
-            elif token == '-cmdbin':
-                print("✓ Command binary mode")
-                i += 1
-            
-            elif token == '-cmdline':
-                print("✓ Command line mode")
-                i += 1
-            
-            elif token == '-rline' and i + 1 < len(tokens):
-                print(f"✓ Run line: {tokens[i + 1]}")
-                i += 2
-            
-            elif token == '-r' and i + 1 < len(tokens):
-                print(f"✓ Run mode: {tokens[i + 1]}")
-                i += 2
-            
-            elif token == '-byp':
-                print("✓ Bypass mode enabled")
-                i += 1
-            
-            elif token == '-h' and i + 1 < len(tokens):
-                print(f"✓ Handle pattern: {tokens[i + 1]}")
-                i += 2
-            
-            elif token == '-ch':
-                print("✓ Chain operation")
-                i += 1
-            
-            elif token == '-numline':
-                print("✓ Number line mode")
-                i += 1
-            
-            elif token == '-ff':
-                print("✓ Fast forward mode")
-                i += 1
-            
-            else:
-                i += 1
-    
-    def handle_if_statement(self, line: str):
-        """Handle if statements"""
-        # Extract condition
-        match = re.search(r'if \((.*?)\) is (.*?)(?:\s+do\s+|\s+|$)', line)
-        if match:
-            var_name = match.group(1).strip()
-            expected = match.group(2).strip()
-            
-            var_value = self.variables.get(var_name, False)
-            expected_value = self.evaluate_expression(expected)
-            
-            if var_value == expected_value:
-                # Execute the rest of the line
-                rest = line[match.end():].strip()
-                if rest:
-                    print(f"✓ Condition met: {var_name} is {expected_value}")
-                    self.process_line(rest)
-            else:
-                print(f"✗ Condition not met: {var_name} is not {expected_value}")
-    
-    def handle_for_loop(self, line: str):
-        """Handle for loops"""
-        match = re.search(r'for \((.*?)\)', line)
-        if match:
-            var_name = match.group(1).strip()
-            print(f"✓ For loop over: {var_name}")
-            # Execute the rest of the line
-            rest = line[match.end():].strip()
-            if rest:
-                self.process_line(rest)
-    
-    def handle_do_statement(self, tokens: List[str]):
-        """Handle do statements"""
-        print(f"✓ Do statement: {' '.join(tokens)}")
-        self.handle_devrc_command(tokens)
-    
-    def execute_section(self, section_name: str):
-        """Execute a specific section"""
-        if section_name not in self.sections:
-            print(f"✗ Section not found: {section_name}")
-            return
-        
-        section_type = self.section_types.get(section_name, "untyped")
-        print(f"\n=== Executing section: {section_name} @[{section_type}] ===")
-        for line in self.sections[section_name]:
-            self.process_line(line)
-    
-    def execute_all(self):
-        """Execute all sections in order"""
-        for section_name, lines in self.sections.items():
-            self.execute_section(section_name)
-    
-    def run(self, filepath: str, sections: Optional[List[str]] = None):
-        """Run the DevRC interpreter"""
-        print(f"DevRC Interpreter - Loading {filepath}")
-        print(f"Root directory: {self.root_dir}")
-        
-        self.sections = self.parse_file(filepath)
-        
-        print(f"\n✓ Total sections loaded: {len(self.sections)}")
-        print(f"✓ Total imports processed: {len(self.imported_files)}")
-        if self.active_environment:
-            print(f"✓ Active environment: {self.active_environment}")
-        
-        if sections:
-            for section in sections:
-                self.execute_section(section)
-        else:
-            self.execute_all()
-        
-        print("\n=== Execution complete ===")
-        if self.imported_files:
-            print(f"Imported files:")
-            for imp in self.imported_files:
-                print(f"  - {imp}")
-        
-        if self.environments:
-            print(f"\nEnvironments:")
-            for env_name, env_info in self.environments.items():
-                active = " (active)" if env_name == self.active_environment else ""
-                print(f"  - {env_name}{active}")
-                print(f"    Path: {env_info['path']}")
-        
-        # Return to root directory after execution
-        if self.active_environment:
-            os.chdir(self.root_dir)
-            print(f"\n✓ Returned to root directory: {self.root_dir}")
-
-
-def main():
-    import argparse
-    
-    parser = argparse.ArgumentParser(description='DevRC DSL Interpreter')
-    parser.add_argument('file', help='.devrc file to execute')
-    parser.add_argument('--section', '-s', action='append', 
-                       help='Specific section(s) to execute')
-    parser.add_argument('--dry-run', '-d', action='store_true',
-                       help='Parse without executing')
-    parser.add_argument('--root', '-r', 
-                       help='Set root directory for environments (default: current directory)')
-    parser.add_argument('--list-envs', action='store_true',
-                       help='List all available environments')
-    
-    args = parser.parse_args()
-    
-    interpreter = DevRCInterpreter()
-    
-    # Set custom root if provided
-    if args.root:
-        interpreter.root_dir = os.path.abspath(args.root)
-        print(f"Root directory set to: {interpreter.root_dir}")
-    
-    if args.dry_run:
-        sections = interpreter.parse_file(args.file)
-        print("Parsed sections:")
-        for name, lines in sections.items():
-            section_type = interpreter.section_types.get(name, "untyped")
-            print(f"\n@[{section_type}]")
-            print(f"[{name}]")
-            for line in lines:
-                print(f"  {line}")
-        
-        if interpreter.environments:
-            print("\n\nEnvironments found:")
-            for env_name, env_info in interpreter.environments.items():
-                print(f"  - {env_name}: {env_info['path']}")
+        sys.stdout.write('\n'.join(out) + '\n')
     
     elif args.list_envs:
         # Scan for environment directories in root
         print(f"Scanning for environments in: {interpreter.root_dir}")
         if os.path.exists(interpreter.root_dir):
-            for item in os.listdir(interpreter.root_dir):
-                item_path = os.path.join(interpreter.root_dir, item)
-                if os.path.isdir(item_path):
-                    print(f"  - {item}")
+            with os.scandir(interpreter.root_dir) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        print(f"  - {entry.name}")
     
     else:
         interpreter.run(args.file, args.section)
@@ -0,0 +1,192 @@
+"""Tests for the DevRC DSL interpreter"""
+
+import os
+import random
+import re
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from drizzle_devrc import DevRCInterpreter, _try_body  # noqa: E402
+
+
+def _reference_tokenize(line):
+    """The original character loop that tokenize replaced"""
+    tokens = []
+    current = []
+    in_quotes = False
+    for char in line:
+        if char == '"':
+            in_quotes = not in_quotes
+            current.append(char)
+        elif char in [' ', '\t'] and not in_quotes:
+            if current:
+                tokens.append(''.join(current))
+                current = []
+        else:
+            current.append(char)
+    if current:
+        tokens.append(''.join(current))
+    return tokens
+
+
+_REFERENCE_TRY = re.compile(r'try\s*\((.+)\)', re.DOTALL)
+
+
+def _reference_try_body(text):
+    """The original try(...) pattern that _try_body replaced"""
+    match = _REFERENCE_TRY.search(text)
+    return match.group(1) if match else None
+
+
+@pytest.mark.parametrize('line', [
+    '',
+    '   ',
+    'dirlist -glob default',
+    '.devrc -out "/bin"',
+    'a"b c"d e',
+    '"quoted run" after',
+    'env="Drizzle" -out try (activate',
+    '-out "unterminated quote runs to the end',
+    '""',
+    'a\tb  \t c',
+    '\ta\t"b\tc"\t',
+    'a\x0bb\x0cc\xa0d',
+    'a\nb\rc',
+])
+def test_tokenize_matches_reference(line):
+    assert DevRCInterpreter().tokenize(line) == _reference_tokenize(line)
+
+
+def test_tokenize_matches_reference_on_random_lines():
+    rng = random.Random(0)
+    alphabet = ' \t"ab-\n\r=(✓\x0b\xa0'
+    tokenize = DevRCInterpreter().tokenize
+    for _ in range(20000):
+        line = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 14)))
+        assert tokenize(line) == _reference_tokenize(line), repr(line)
+
+
+@pytest.mark.parametrize('text', [
+    '',
+    'try',
+    'try ()',
+    'try (x)',
+    'try\t( a b )',
+    'try (a) (b)',
+    'tryx try (y)',
+    'retry (z)',
+    'try x) try (y',
+    'env="Drizzle" -out try (activate)',
+])
+def test_try_body_matches_reference(text):
+    assert _try_body(text) == _reference_try_body(text)
+
+
+def test_try_body_matches_reference_on_random_text():
+    rng = random.Random(0)
+    pieces = ['try', '(', ')', ' ', '\t', 'a', 't', 'r', 'y', 'x']
+    for _ in range(20000):
+        text = ''.join(rng.choice(pieces) for _ in range(rng.randint(0, 10)))
+        assert _try_body(text) == _reference_try_body(text), repr(text)
+
+
+def test_activation_resolves_paths_in_environment_directory(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    env_dir = tmp_path / 'envx'
+    env_dir.mkdir()
+    (env_dir / 'lib.devrc').write_text('[shared]\nx=1\n')
+    (tmp_path / 'main.devrc').write_text(
+        '#[envx]/ACTIVATE\n'
+        '@DEVRC.IMPORT.lib="lib.devrc"\n'
+        '[build]\n'
+        '.devrc -crfolder "made" -out "outdir/"\n'
+    )
+
+    interpreter = DevRCInterpreter()
+    interpreter.run('main.devrc')
+
+    # The import, -crfolder and -out all resolve inside the environment
+    assert list(interpreter.imported_files) == [str(env_dir / 'lib.devrc')]
+    assert (env_dir / 'made').is_dir()
+    assert (env_dir / 'outdir').is_dir()
+    assert not (tmp_path / 'made').exists()
+    assert not (tmp_path / 'outdir').exists()
+
+    # The process working directory is never changed
+    assert os.getcwd() == str(tmp_path)
+
+
+def test_second_run_activates_environment_again(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'main.devrc').write_text(
+        '#[envx]/ACTIVATE\n'
+        '[build]\n'
+        '.devrc -crfolder "made"\n'
+    )
+
+    interpreter = DevRCInterpreter()
+    interpreter.run('main.devrc')
+    (tmp_path / 'envx' / 'made').rmdir()
+    interpreter.run('main.devrc')
+
+    assert (tmp_path / 'envx' / 'made').is_dir()
+    assert not (tmp_path / 'made').exists()
+
+
+def test_process_line_strips_leading_whitespace(capsys):
+    interpreter = DevRCInterpreter()
+    interpreter.variables['x'] = '1'
+    interpreter.process_line('  if (x) is 1 do .devrc -plugin')
+    interpreter.process_line('\tfor (items) .devrc -force')
+
+    out = capsys.readouterr().out
+    assert '✓ Condition met: x is 1' in out
+    assert '✓ Plugin mode enabled' in out
+    assert '✓ For loop over: items' in out
+    assert '✓ Force mode enabled' in out
+
+
+def test_mid_line_if_and_for_are_not_conditionals(capsys):
+    interpreter = DevRCInterpreter()
+    interpreter.variables['x'] = '1'
+    interpreter.process_line('if x do if (x) is 1 do .devrc -plugin')
+    interpreter.process_line('for x for (items) .devrc -force')
+
+    assert capsys.readouterr().out == ''
+
+
+def test_comment_lines_are_not_processed(capsys):
+    interpreter = DevRCInterpreter()
+    interpreter._process_line('#x=1')
+    interpreter._process_line('# .devrc -plugin')
+
+    assert interpreter.variables == {}
+    interpreter._flush_log()
+    assert capsys.readouterr().out == ''
+
+
+def test_quiet_mode_keeps_errors_and_output(tmp_path, monkeypatch, capsys):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'main.devrc').write_text(
+        '@DEVRC.IMPORT.lib="missing.devrc"\n'
+        '[build]\n'
+        '.devrc -plugin -out "outdir/"\n'
+    )
+
+    interpreter = DevRCInterpreter()
+    interpreter.verbose = False
+    interpreter.run('main.devrc')
+
+    out = capsys.readouterr().out
+    # Per-line status messages are hidden
+    assert '✓ Plugin mode enabled' not in out
+    assert '✓ Prepared output directory' not in out
+    # Errors, section headers and the summary are still reported
+    assert '✗ Import file not found: missing.devrc' in out
+    assert '=== Executing section: build @[untyped] ===' in out
+    assert '✓ Total sections loaded: 1' in out
+    # -out still takes effect
+    assert (tmp_path / 'outdir').is_dir()